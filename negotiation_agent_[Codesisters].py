@@ -1,10 +1,9 @@
-import json
-import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from enum import Enum
 from abc import ABC, abstractmethod
-import random
+from importlib.util import find_spec
 
 # ============================================
 # PART 1: DATA STRUCTURES (DO NOT MODIFY)
@@ -112,7 +111,161 @@ class BaseBuyerAgent(ABC):
 # PART 3: YOUR IMPLEMENTATION STARTS HERE
 # ============================================
 
-class YourBuyerAgent(BaseBuyerAgent):
+class Personality(dict):
+    """Read-only personality dict; the dict mutators raise TypeError."""
+    __slots__ = ()
+
+    def __init__(self, personality_type: str, traits: Tuple[str, ...],
+                 negotiation_style: str, catchphrases: Tuple[str, str, str]):
+        super().__init__(
+            personality_type=personality_type, traits=traits,
+            negotiation_style=negotiation_style, catchphrases=catchphrases,
+        )
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Personality is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # Rebuild through __init__; the default dict pickling path would call __setitem__
+        return type(self), tuple(self.values())
+
+@lru_cache(maxsize=128)
+def _product_descriptor(quantity: int, grade: str, name: str) -> str:
+    """'<qty> units of <grade>-grade <name>' as used in opening messages, formatted once per product."""
+    return f"{quantity} units of {grade}-grade {name}"
+
+# Origins that earn a premium on fair value (shared by buyer and seller)
+_PREMIUM_ORIGINS = frozenset({"colombia", "ethiopia", "yirgacheffe"})
+
+# Price anchors per side, memoised per agent class (see _DiplomatAgentMixin)
+def _buyer_anchors(qmap: Dict[str, float], base: int, grade: str, origin: str, quantity: int) -> Tuple[int, Tuple[int, ...]]:
+    """Buyer fair price and its cut-offs (low, high, t85, t015, t90, t92, t78), computed together."""
+    quality_factor = qmap.get(grade.strip().lower(), 1.0)
+    origin_factor = 1.05 if origin.lower() in _PREMIUM_ORIGINS else 1.0
+    volume_factor = 0.98 if quantity >= 200 else 1.0  # small bulk discount expectation
+    fair = int(round(base * quality_factor * origin_factor * volume_factor))
+    # As buyer, try to land between 88%–97% of our fair value
+    return fair, tuple(int(fair * c) for c in (0.88, 0.97, 0.85, 0.015, 0.90, 0.92, 0.78))
+
+def _seller_anchors(qmap: Dict[str, float], base: int, grade: str, origin: str) -> Tuple[int, Tuple[int, int]]:
+    """Seller fair price and zone (low, high). No volume discount on the sell side."""
+    quality_factor = qmap.get(grade.strip().lower(), 1.0)
+    origin_factor = 1.05 if origin.lower() in _PREMIUM_ORIGINS else 1.0
+    logistics = 1.01  # small handling/assurance
+    fair = int(round(base * quality_factor * origin_factor * logistics))
+    # Seller would like 100%–110% of fair
+    return fair, (int(fair * 1.00), int(fair * 1.10))
+
+# Buyer message templates (positional args; catchphrases come from the cached _cp* attributes)
+_OPEN_TMPL = (
+    "{} For {} from {}, my opening is ₹{:,}. "
+    "I’m anchoring on market benchmarks with quality factored in. {}"
+)
+_ACCEPT_TMPL = "Agreed at ₹{:,}. {} Appreciate the collaborative approach."
+_SNAP_TMPL = "That's compelling. I accept ₹{:,}. Looking forward to a long-term relationship."
+_ALIGNED_TMPL = "We're aligned. Let's close at ₹{:,}. {}"
+_FAIR_ENOUGH_TMPL = "Fair enough—accepted at ₹{:,}. {}"
+_FINAL_TMPL = "To bridge the gap, I can finalize at ₹{:,}. {}"
+_COUNTER_TMPL = (
+    "I appreciate your position. Based on market and quality, I can move to ₹{:,}. "
+    "If you can narrow the difference, we’ll land a repeatable win–win."
+)
+
+# Decision codes returned by _decide_counter (accept codes sort after counter codes)
+_COUNTER = 0        # keep negotiating at the returned counter
+_COUNTER_FINAL = 1  # best-and-final counter in the closing rounds
+_ACCEPT_ZONE = 2    # seller inside our target zone
+_ACCEPT_SNAP = 3    # seller well below fair
+_ACCEPT_ALIGNED = 4 # seller within tolerance of our proposal
+_ACCEPT_UNDER = 5   # seller at or below our proposal
+
+_DEAL_STATUS = (DealStatus.ONGOING,) * 2 + (DealStatus.ACCEPTED,) * 4  # indexed by decision code
+
+
+def _decide_counter(seller_price, budget, low, high, t85, t015, t90, t92, last_offer, round_num):
+    """Numeric core of the buyer response (no strings, so numba can compile it for the sweep)."""
+    # If seller already within our target zone and under budget -> accept
+    if seller_price <= budget and low <= seller_price <= high:
+        return _ACCEPT_ZONE, seller_price
+
+    # If extremely good (≤ 85% of fair) and under budget -> snap accept
+    if seller_price <= budget and seller_price <= t85:
+        return _ACCEPT_SNAP, seller_price
+
+    # Otherwise counter using principled, reciprocal concessions
+    rounds_left = 10 - round_num
+
+    # Concession schedule: larger early, smaller late; avoid exceeding budget
+    if rounds_left >= 6:
+        step = 0.07  # 7% increase early
+    elif rounds_left >= 3:
+        step = 0.045
+    else:
+        step = 0.03  # close-out micro-moves
+
+    # Move toward mid between last_offer and min(seller, budget), but control by step
+    target_point = min(seller_price, budget)
+    midpoint = (last_offer + target_point) / 2
+    # (last_offer * (1 + step) already dominates last_offer, so it needs no separate max term)
+    candidate = int(max(last_offer * (1 + step), midpoint * 0.97))
+
+    # Ensure we don't overbid beyond high unless time-critical; one clip, bounds by round
+    # (min(max(x, lo), hi) is np.clip: hi wins if the bounds cross)
+    if round_num >= 9:
+        # Final bridging move—respect budget cap
+        proposed = min(max(candidate, t90), budget)
+    else:
+        proposed = min(max(candidate, 0), budget, max(t92, last_offer))
+
+    # If seller drops close to our proposed (within 1.5%), accept next
+    if seller_price <= budget and abs(seller_price - proposed) <= t015:
+        return _ACCEPT_ALIGNED, seller_price
+
+    # Guard: proposed never exceeds budget; if seller below our proposal, accept their price
+    if seller_price <= proposed:
+        return _ACCEPT_UNDER, seller_price
+
+    return (_COUNTER_FINAL if round_num >= 9 else _COUNTER), proposed
+
+
+class _DiplomatAgentMixin:
+    """Shared construction and per-class anchor cache; subclasses set _QMAP, _ANCHORS and _anchors."""
+
+    _QMAP: Dict[str, float] = {}
+    _ANCHORS: Callable[..., Tuple[int, Tuple[int, ...]]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # One cache per class, so agents with a different _QMAP never share entries
+        cls._cached_anchors = staticmethod(lru_cache(maxsize=128)(partial(cls._ANCHORS, cls._QMAP)))
+
+    def __init__(self, name: str, verbose: bool = True):
+        super().__init__(name)
+        # verbose=False skips message formatting (returns ""), for price-only sweeps
+        self.verbose = verbose
+        # Cache personality strings once; they are read on every negotiation round
+        self._cp0, self._cp1, self._cp2 = self.personality["catchphrases"]
+
+
+# Shared, immutable buyer personality (built once at import, not per agent)
+_DIPLOMAT_BUYER_PERSONALITY = Personality(
+    personality_type="diplomatic",
+    traits=("collaborative", "clear-communication", "calm", "principled", "win-win"),  # Define 3-5 traits
+    negotiation_style=(
+        "Leads with common ground, anchors on fair market data, "
+        "makes reciprocal concessions, and signals a clear zone of agreement."
+    ),
+    catchphrases=(
+        "Let's find the number that respects both sides.",
+        "I'm aiming for a fair,repeatable deal.",
+        "Win-win or no deal."),  # 2-3 signature phrases
+)
+
+
+class YourBuyerAgent(_DiplomatAgentMixin, BaseBuyerAgent):
     """
     YOUR BUYER AGENT IMPLEMENTATION
     
@@ -123,65 +276,66 @@ class YourBuyerAgent(BaseBuyerAgent):
     4. Use market price as reference
     5. Maximum 10 rounds - don't let negotiations timeout
     """
+
+    # Buyer-side quality adjustments keyed by normalised grade
+    _QMAP = {"export": 1.15, "a": 1.05, "b": 0.95}
+    _ANCHORS = staticmethod(_buyer_anchors)
+
+    def __init__(self, name: str, verbose: bool = True):
+        super().__init__(name, verbose)
+        cp0, cp1, cp2 = self._cp0, self._cp1, self._cp2
+        # Message builders indexed by _decide_counter's decision code
+        self._messages = (
+            _COUNTER_TMPL.format,
+            lambda price: _FINAL_TMPL.format(price, cp2),
+            lambda price: _ACCEPT_TMPL.format(price, cp2),
+            _SNAP_TMPL.format,
+            lambda price: _ALIGNED_TMPL.format(price, cp0),
+            lambda price: _FAIR_ENOUGH_TMPL.format(price, cp1),
+        )
     
-    def define_personality(self) -> Dict[str, Any]:
+    def define_personality(self) -> Personality:
         
         #TODO: Good in communication,Calm at any situation
         #Choose from: diplomatic
-        return {
-            "personality_type": "diplomatic", 
-            "traits": ["collaborative", "clear-communication","calm","principled","win-win"],  # Define 3-5 traits
-            "negotiation_style":("Leads with common ground ,anchors on fair market data","makes reciprocal concessions, and signals a clear zone of agreement."),
-            "catchphrases": [
-                "Let's find the number that respects both sides.",
-                "I'm aiming for a fair,repeatable deal.",
-                "Win-win or no deal."]  # 2-3 signature phrases
-        }
+        return _DIPLOMAT_BUYER_PERSONALITY
         
     # ---------- Helper Methods ----------
-    def _quality_multiplier(self, product: Product) -> float:
-        q = product.quality_grade.strip().lower()
-        if q == "export":
-            return 1.15
-        if q == "a":
-            return 1.05
-        if q == "b":
-            return 0.95
-        return 1.0
+    def _anchors(self, product: Product) -> Tuple[int, Tuple[int, ...]]:
+        """(fair, derived cut-offs) for this product, memoised on its raw fields."""
+        return self._cached_anchors(
+            product.base_market_price, product.quality_grade, product.origin, product.quantity
+        )
 
     def calculate_fair_price(self, product: Product) -> int:
         """
         Compute an internal 'fair' anchor around market price with quality adjustments.
         """
-        base = product.base_market_price
-        quality_factor = self._quality_multiplier(product)
-        origin_factor = 1.05 if product.origin.lower() in {"colombia", "ethiopia", "yirgacheffe"} else 1.0
-        volume_factor = 0.98 if product.quantity >= 200 else 1.0  # small bulk discount expectation
-        fair = int(round(base * quality_factor * origin_factor * volume_factor))
-        return fair
+        return self._anchors(product)[0]
 
     def target_zone(self, product: Product) -> Tuple[int, int]:
         """
         Return a target accept range (low, high) for final deal from the buyer perspective.
         """
-        fair = self.calculate_fair_price(product)
-        # As buyer, try to land between 88%–97% of our fair value
-        low = int(fair * 0.88)
-        high = int(fair * 0.97)
-        return low, high
-    
+        return self._anchors(product)[1][:2]
+
+    def _thresholds(self, product: Product) -> Tuple[int, ...]:
+        """Fair-derived cut-offs (low, high, t85, t015, t90, t92, t78)."""
+        return self._anchors(product)[1]
+
     # ---------- Core Strategy ----------
     def generate_opening_offer(self, context: NegotiationContext) -> Tuple[int, str]:
         fair = self.calculate_fair_price(context.product)
         # Diplomatic anchor: assertively low but defensible (about 78% of fair)
         opening_price = int(fair * 0.78)
         opening_price = min(opening_price, context.your_budget)
+        if not self.verbose:
+            return opening_price, ""
 
-        message = (
-            f"{self.personality['catchphrases'][0]} For {context.product.quantity} units of "
-            f"{context.product.quality_grade}-grade {context.product.name} from {context.product.origin}, "
-            f"my opening is ₹{opening_price:,}. I’m anchoring on market benchmarks with quality factored in. "
-            f"{self.personality['catchphrases'][1]}"
+        product = context.product
+        message = _OPEN_TMPL.format(
+            self._cp0, _product_descriptor(product.quantity, product.quality_grade, product.name),
+            product.origin, opening_price, self._cp1
         )
         return opening_price, message
 
@@ -191,77 +345,19 @@ class YourBuyerAgent(BaseBuyerAgent):
         seller_price: int,
         seller_message: str
     ) -> Tuple[DealStatus, int, str]:
-        product = context.product
-        budget = context.your_budget
-        fair = self.calculate_fair_price(product)
-        low, high = self.target_zone(product)
-
-        # If seller already within our target zone and under budget -> accept
-        if seller_price <= budget and low <= seller_price <= high:
-            return DealStatus.ACCEPTED, seller_price, (
-                f"Agreed at ₹{seller_price:,}. {self.personality['catchphrases'][2]} "
-                f"Appreciate the collaborative approach."
-            )
-
-        # If extremely good (≤ 85% of fair) and under budget -> snap accept
-        if seller_price <= budget and seller_price <= int(fair * 0.85):
-            return DealStatus.ACCEPTED, seller_price, (
-                f"That's compelling. I accept ₹{seller_price:,}. Looking forward to a long-term relationship."
-            )
-
-        # Otherwise counter using principled, reciprocal concessions
-        last_offer = context.your_offers[-1] if context.your_offers else int(fair * 0.78)
-        rounds_left = 10 - context.current_round
-
-        # Concession schedule: larger early, smaller late; avoid exceeding budget
-        if rounds_left >= 6:
-            step = 0.07  # 7% increase early
-        elif rounds_left >= 3:
-            step = 0.045
-        else:
-            step = 0.03  # close-out micro-moves
+        # One anchor-cache lookup per round yields every cut-off; each context field is read once
+        low, high, t85, t015, t90, t92, t78 = self._thresholds(context.product)
+        your_offers = context.your_offers
+        last_offer = your_offers[-1] if your_offers else t78
 
-        # Move toward mid between last_offer and min(seller, budget), but control by step
-        target_point = min(seller_price, budget)
-        midpoint = (last_offer + target_point) / 2
-        proposed = int(min(budget, max(last_offer, last_offer * (1 + step), midpoint * 0.97)))
-
-        # Ensure we don't overbid beyond high unless time-critical
-        if context.current_round >= 9:
-            # Final bridging move—respect budget cap
-            proposed = min(budget, max(proposed, int(fair * 0.90)))
-        else:
-            proposed = min(proposed, max(int(fair * 0.92), last_offer))
-
-        # If seller drops close to our proposed (within 1.5%), accept next
-        if seller_price <= budget and abs(seller_price - proposed) <= int(0.015 * fair):
-            return DealStatus.ACCEPTED, seller_price, (
-                f"We're aligned. Let's close at ₹{seller_price:,}. "
-                f"{self.personality['catchphrases'][0]}"
-            )
-
-        # Guard: never exceed budget; if seller below our proposal, accept their price
-        if seller_price <= min(budget, proposed):
-            return DealStatus.ACCEPTED, seller_price, (
-                f"Fair enough—accepted at ₹{seller_price:,}. {self.personality['catchphrases'][1]}"
-            )
-
-        # Compose diplomatic counter
-        counter_offer = min(proposed, budget)
-
-        # If final round, present a best-and-final
-        if context.current_round >= 9:
-            message = (
-                f"To bridge the gap, I can finalize at ₹{counter_offer:,}. "
-                f"{self.personality['catchphrases'][2]}"
-            )
-        else:
-            message = (
-                f"I appreciate your position. Based on market and quality, I can move to ₹{counter_offer:,}. "
-                f"If you can narrow the difference, we’ll land a repeatable win–win."
-            )
-
-        return DealStatus.ONGOING, counter_offer, message
+        code, proposed = _decide_counter(
+            seller_price, context.your_budget, low, high, t85, t015, t90, t92, last_offer, context.current_round
+        )
+        # Accepts keep the caller's seller_price as given; counters are always int
+        price = seller_price if code >= _ACCEPT_ZONE else int(proposed)
+        if not self.verbose:
+            return _DEAL_STATUS[code], price, ""
+        return _DEAL_STATUS[code], price, self._messages[code](price)
 
     def get_personality_prompt(self) -> str:
         return (
@@ -382,7 +478,7 @@ def run_negotiation_test(buyer_agent: BaseBuyerAgent, product: Product, buyer_bu
 
 class BaseSellerAgent(ABC):
     """Minimal seller base to mirror testing on the seller side."""
-    def _init_(self, name: str):
+    def __init__(self, name: str):
         self.name = name
         self.personality = self.define_personality()
 
@@ -407,7 +503,20 @@ class BaseSellerAgent(ABC):
         pass
 
 
-class YourSellerAgent(BaseSellerAgent):
+# Shared, immutable seller personality (built once at import, not per agent)
+_DIPLOMAT_SELLER_PERSONALITY = Personality(
+    personality_type="diplomatic",
+    traits=("collaborative", "transparent", "calm", "principled", "win-win"),
+    negotiation_style="Opens high with rationale, reciprocates genuine moves, seeks stable partnerships.",
+    catchphrases=(
+        "Let's align on value and quality.",
+        "I prioritize repeat business over one-off wins.",
+        "We can bridge this thoughtfully."
+    )
+)
+
+
+class YourSellerAgent(_DiplomatAgentMixin, BaseSellerAgent):
     """
     Diplomat-style seller mirroring the buyer's temperament.
     - Anchors above market with justification
@@ -415,46 +524,31 @@ class YourSellerAgent(BaseSellerAgent):
     - Closes early if buyer reaches fair value corridor
     """
 
-    def define_personality(self) -> Dict[str, Any]:
-        return {
-            "personality_type": "diplomatic",
-            "traits": ["collaborative", "transparent", "calm", "principled", "win-win"],
-            "negotiation_style": "Opens high with rationale, reciprocates genuine moves, seeks stable partnerships.",
-            "catchphrases": [
-                "Let's align on value and quality.",
-                "I prioritize repeat business over one-off wins.",
-                "We can bridge this thoughtfully."
-            ]
-        }
+    # Seller-side quality adjustments keyed by normalised grade
+    _QMAP = {"export": 1.15, "a": 1.06, "b": 0.94}
+    _ANCHORS = staticmethod(_seller_anchors)
+
+    def define_personality(self) -> Personality:
+        return _DIPLOMAT_SELLER_PERSONALITY
 
-    def _quality_multiplier(self, product: Product) -> float:
-        q = product.quality_grade.strip().lower()
-        if q == "export":
-            return 1.15
-        if q == "a":
-            return 1.06
-        if q == "b":
-            return 0.94
-        return 1.0
+    def _anchors(self, product: Product) -> Tuple[int, Tuple[int, int]]:
+        """(fair, zone) for this product, memoised on the raw fields the seller prices on."""
+        return self._cached_anchors(product.base_market_price, product.quality_grade, product.origin)
 
     def fair_price(self, product: Product) -> int:
-        base = product.base_market_price
-        qf = self._quality_multiplier(product)
-        origin_factor = 1.05 if product.origin.lower() in {"colombia", "ethiopia", "yirgacheffe"} else 1.0
-        logistics = 1.01  # small handling/assurance
-        return int(round(base * qf * origin_factor * logistics))
+        return self._anchors(product)[0]
 
     def seller_zone(self, product: Product) -> Tuple[int, int]:
-        fair = self.fair_price(product)
-        # Seller would like 100%–110% of fair
-        return int(fair * 1.00), int(fair * 1.10)
+        return self._anchors(product)[1]
 
     def generate_opening_price(self, product: Product) -> Tuple[int, str]:
         fair = self.fair_price(product)
         opening = int(fair * 1.28)  # assertive but not outrageous
+        if not self.verbose:
+            return opening, ""
+        descriptor = _product_descriptor(product.quantity, product.quality_grade, product.name)
         msg = (
-            f"{self.personality['catchphrases'][0]} For {product.quantity} units of "
-            f"{product.quality_grade}-grade {product.name} ({product.origin}), my opening is ₹{opening:,}. "
+            f"{self._cp0} For {descriptor} ({product.origin}), my opening is ₹{opening:,}. "
             f"This reflects current market, quality, and assurance."
         )
         return opening, msg
@@ -465,12 +559,14 @@ class YourSellerAgent(BaseSellerAgent):
 
         # Accept if buyer enters our target zone
         if low <= buyer_offer <= high:
-            return "accepted", buyer_offer, (
-                f"Agreed at ₹{buyer_offer:,}. {self.personality['catchphrases'][1]}"
-            )
+            if not self.verbose:
+                return "accepted", buyer_offer, ""
+            return "accepted", buyer_offer, f"Agreed at ₹{buyer_offer:,}. {self._cp1}"
 
         # If compelling (>= 98% of fair), accept to secure relationship
         if buyer_offer >= int(fair * 0.98):
+            if not self.verbose:
+                return "accepted", buyer_offer, ""
             return "accepted", buyer_offer, "That's reasonable—let's lock it in."
 
         # Concession pattern
@@ -496,9 +592,11 @@ class YourSellerAgent(BaseSellerAgent):
         if round_num >= 8:
             counter = int(max(counter, fair))  # be willing to close near fair
 
+        if not self.verbose:
+            return "ongoing", counter, ""
         msg = (
             f"I appreciate your offer. Considering quality and fulfillment, I can improve to ₹{counter:,}. "
-            f"{self.personality['catchphrases'][2]}"
+            f"{self._cp2}"
         )
         return "ongoing", counter, msg
 
@@ -513,8 +611,12 @@ class YourSellerAgent(BaseSellerAgent):
 
 # Mock Buyer for Seller Testing
 class MockBuyerForSeller:
-    def _init_(self, budget: int):
+    def __init__(self, budget: int, product: Product):
         self.budget = budget
+        # Product-derived thresholds and the per-round concession table, fixed for the negotiation
+        self._accept_at = int(product.base_market_price * 0.95)
+        self._floor = int(product.base_market_price * 0.90)
+        self._bumps = (1.07,) * 8 + (1.05,) * 2  # indexed by round_num; later rounds reuse the last entry
 
     def get_opening_offer(self, product: Product) -> Tuple[int, str]:
         # Opens at ~80% of market as a reasonable buyer
@@ -522,24 +624,19 @@ class MockBuyerForSeller:
         opening = min(opening, self.budget)
         return opening, f"I'm opening at ₹{opening:,} based on market checks."
 
-    def respond_to_seller(self, seller_price: int, round_num: int, product: Product) -> Tuple[int, str, bool]:
+    def respond_to_seller(self, seller_price: int, round_num: int) -> Tuple[int, str, bool]:
         # Simple principled increases capped by budget
-        if seller_price <= self.budget and seller_price <= int(product.base_market_price * 0.95):
+        if seller_price <= self.budget and seller_price <= self._accept_at:
             return seller_price, "Accepted. Let's proceed.", True
 
-        # Concession pattern
-        if round_num >= 8:
-            bump = 0.05
-        else:
-            bump = 0.07
-        # last offer approximated as seller_price * (1 - margin); propose up by bump from last
-        counter = min(int(max(seller_price * (1 - 0.12), product.base_market_price * 0.90)), self.budget)
-        counter = min(int(counter * (1 + bump)), self.budget)
+        # last offer approximated as seller_price * (1 - 0.12); propose up by this round's bump from last
+        counter = min(max(int(seller_price * 0.88), self._floor), self.budget)
+        counter = min(int(counter * self._bumps[min(round_num, 9)]), self.budget)
         return counter, f"I can move to ₹{counter:,}. Can you meet me closer?", False
 
 
 def run_seller_negotiation_test(seller_agent: YourSellerAgent, product: Product, buyer_budget: int) -> Dict[str, Any]:
-    mock_buyer = MockBuyerForSeller(buyer_budget)
+    mock_buyer = MockBuyerForSeller(buyer_budget, product)
     messages = []
 
     seller_price, seller_msg = seller_agent.generate_opening_price(product)
@@ -554,7 +651,7 @@ def run_seller_negotiation_test(seller_agent: YourSellerAgent, product: Product,
         if round_num == 0:
             buyer_offer, buyer_msg = mock_buyer.get_opening_offer(product)
         else:
-            buyer_offer, buyer_msg, buyer_accepts = mock_buyer.respond_to_seller(seller_price, round_num, product)
+            buyer_offer, buyer_msg, buyer_accepts = mock_buyer.respond_to_seller(seller_price, round_num)
             if buyer_accepts:
                 deal_made = True
                 final_price = buyer_offer
@@ -581,17 +678,189 @@ def run_seller_negotiation_test(seller_agent: YourSellerAgent, product: Product,
     }
     return result
 
+# ============================================
+# NEW: BATCHED BUYER EVALUATION (NumPy)
+# ============================================
+
+# The batch paths replay YourBuyerAgent's own offer policy; only its thresholds come from the agent
+_BATCH_POLICY = ("generate_opening_offer", "respond_to_seller_offer")
+
+
+def _threshold_array(buyer_agent: YourBuyerAgent, products: List[Product], n: int):
+    """(N, 7) int64 array of buyer_agent._thresholds; TypeError if its offer policy is overridden."""
+    agent_cls = type(buyer_agent)
+    overridden = [name for name in _BATCH_POLICY if getattr(agent_cls, name, None) is not getattr(YourBuyerAgent, name)]
+    if overridden:
+        raise TypeError(
+            f"{type(buyer_agent).__name__} overrides {', '.join(overridden)}; "
+            "the batch paths only replay YourBuyerAgent's policy"
+        )
+    import numpy as np
+
+    return np.array([buyer_agent._thresholds(p) for p in products], dtype=np.int64).reshape(n, 7)
+
+
+def batched_negotiate(buyer_agent: YourBuyerAgent, products: List[Product], budgets, seller_mins) -> Dict[str, Any]:
+    """NumPy replay of the buyer policy vs MockSellerAgent for N scenarios: deal_made, final_price (-1: none), rounds."""
+    import numpy as np
+
+    budget = np.asarray(budgets, dtype=np.int64)
+    seller_min = np.asarray(seller_mins, dtype=np.int64)
+    n = budget.shape[0]
+    market = np.fromiter((p.base_market_price for p in products), dtype=np.int64, count=n)
+    # Columns follow YourBuyerAgent._thresholds: (low, high, t85, t015, t90, t92, t78)
+    low, high, snap, tol, floor_final, cap, opening = _threshold_array(buyer_agent, products, n).T
+
+    seller_price = (market * 1.5).astype(np.int64)
+    last_buyer = np.minimum(opening, budget)
+    final_price = np.full(n, -1, dtype=np.int64)
+    rounds = np.full(n, 10, dtype=np.int64)
+    active = np.ones(n, dtype=bool)
+
+    for round_num in range(10):
+        current_round = round_num + 1
+
+        if round_num > 0:
+            # Buyer responds to the seller's latest price
+            rounds_left = 10 - current_round
+            step = 0.07 if rounds_left >= 6 else (0.045 if rounds_left >= 3 else 0.03)
+            in_budget = seller_price <= budget
+            target_point = np.minimum(seller_price, budget)
+            midpoint = (last_buyer + target_point) / 2
+            candidate = np.maximum(last_buyer * (1 + step), midpoint * 0.97).astype(np.int64)
+            if current_round >= 9:
+                proposed = np.clip(candidate, floor_final, budget)
+            else:
+                proposed = np.clip(candidate, 0, np.minimum(budget, np.maximum(cap, last_buyer)))
+
+            accept_mask = active & (
+                (in_budget & (low <= seller_price) & (seller_price <= high))
+                | (in_budget & (seller_price <= snap))
+                | (in_budget & (np.abs(seller_price - proposed) <= tol))
+                | (seller_price <= proposed)
+            )
+            final_price[accept_mask] = seller_price[accept_mask]
+            rounds[accept_mask] = current_round
+            active &= ~accept_mask
+            last_buyer = np.where(active, proposed, last_buyer)
+
+        # Seller responds to the buyer's offer
+        seller_accepts = active & (last_buyer >= seller_min * 1.1)
+        final_price[seller_accepts] = last_buyer[seller_accepts]
+        rounds[seller_accepts] = current_round
+        active &= ~seller_accepts
+        markup = 1.05 if round_num >= 8 else 1.15
+        seller_price = np.where(active, np.maximum(seller_min, (last_buyer * markup).astype(np.int64)), seller_price)
+
+        if not active.any():
+            break
+
+    return {
+        "deal_made": ~active,
+        "final_price": final_price,
+        "rounds": rounds,
+    }
+
+
+def run_negotiation_test_batch(buyer_fn, products: List[Product], budgets, seller_mins) -> Dict[str, Any]:
+    """run_negotiation_test's metrics for YourBuyerAgent's policy only (not a general counterpart)."""
+    import numpy as np
+
+    budget = np.asarray(budgets, dtype=np.int64)
+    market = np.fromiter((p.base_market_price for p in products), dtype=np.int64, count=budget.shape[0])
+    result = batched_negotiate(buyer_fn(), products, budget, seller_mins)
+    deal = result["deal_made"]
+    # Zero the metrics for failed negotiations, as the scalar harness does
+    price = np.where(deal, result["final_price"], 0)
+    savings = np.where(deal, budget - price, 0)
+    result["savings"] = savings
+    # Divide only the deal rows, so a zero budget or market on a failed row cannot warn
+    result["savings_pct"] = np.divide(savings, budget, out=np.zeros(deal.shape), where=deal) * 100
+    result["below_market_pct"] = np.divide(market - price, market, out=np.zeros(deal.shape), where=deal) * 100
+    return result
+
+
+def _build_sweep(jit, parallel_jit, prange):
+    """Sweep kernel over _decide_counter, built with the given decorators (numba's or identity)."""
+    decide = jit(_decide_counter)
+
+    @jit
+    def simulate(budget, seller_min, market, low, high, t85, t015, t90, t92, t78):
+        # Price-only replay of run_negotiation_test for one scenario; final_price -1 means no deal
+        seller_price = int(market * 1.5)
+        buyer_offer = min(t78, budget)
+        for round_num in range(10):
+            current_round = round_num + 1
+
+            if round_num > 0:
+                code, buyer_offer = decide(
+                    seller_price, budget, low, high, t85, t015, t90, t92, buyer_offer, current_round
+                )
+                if code >= _ACCEPT_ZONE:
+                    return seller_price, current_round
+
+            # Mock seller: accept at a good margin, otherwise counter above our offer
+            if buyer_offer >= seller_min * 1.1:
+                return buyer_offer, current_round
+            if round_num >= 8:
+                seller_price = max(seller_min, int(buyer_offer * 1.05))
+            else:
+                seller_price = max(seller_min, int(buyer_offer * 1.15))
+        return -1, 10
+
+    @parallel_jit
+    def sweep(budgets, seller_mins, markets, thresholds, final_price, rounds):
+        # Scenarios are independent, so prange spreads them across cores
+        for i in prange(budgets.shape[0]):
+            price, n_rounds = simulate(
+                budgets[i], seller_mins[i], markets[i], thresholds[i, 0], thresholds[i, 1], thresholds[i, 2],
+                thresholds[i, 3], thresholds[i, 4], thresholds[i, 5], thresholds[i, 6]
+            )
+            final_price[i] = price
+            rounds[i] = n_rounds
+
+    return sweep
+
+
+@lru_cache(maxsize=None)
+def _sweep_kernel() -> Callable[..., None]:
+    """_build_sweep under numba when installed, imported and compiled on first use."""
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; fall back to plain Python
+        return _build_sweep(lambda fn: fn, lambda fn: fn, range)
+    return _build_sweep(njit, njit(parallel=True), prange)
+
+
+def sweep_negotiations(buyer_agent: YourBuyerAgent, products: List[Product], budgets, seller_mins) -> Dict[str, Any]:
+    """batched_negotiate's results via a numba-parallel per-scenario sweep, compiled on first call."""
+    import numpy as np
+
+    budget = np.asarray(budgets, dtype=np.int64)
+    seller_min = np.asarray(seller_mins, dtype=np.int64)
+    n = budget.shape[0]
+    market = np.fromiter((p.base_market_price for p in products), dtype=np.int64, count=n)
+    thresholds = _threshold_array(buyer_agent, products, n)
+    final_price = np.empty(n, dtype=np.int64)
+    rounds = np.empty(n, dtype=np.int64)
+    _sweep_kernel()(budget, seller_min, market, thresholds, final_price, rounds)
+    return {
+        "deal_made": final_price >= 0,
+        "final_price": final_price,
+        "rounds": rounds,
+    }
+
 # ============================================
 # PART 5: TEST YOUR AGENT
 # ============================================
 
-def buyer() -> YourBuyerAgent:
-    """Factory for the diplomat buyer agent (for training/plug-in)."""
-    return YourBuyerAgent("DiplomatBuyer")
+def buyer(verbose: bool = True) -> YourBuyerAgent:
+    """Factory for the diplomat buyer agent (for training/plug-in). verbose=False skips messages."""
+    return YourBuyerAgent("DiplomatBuyer", verbose)
 
-def seller() -> YourSellerAgent:
-    """Factory for the diplomat seller agent (for training/plug-in)."""
-    return YourSellerAgent("DiplomatSeller")
+def seller(verbose: bool = True) -> YourSellerAgent:
+    """Factory for the diplomat seller agent (for training/plug-in). verbose=False skips messages."""
+    return YourSellerAgent("DiplomatSeller", verbose)
 
 def test_buyer_agent():
     """Run tests for the BUYER agent against the provided MockSellerAgent."""
@@ -641,6 +910,47 @@ def test_buyer_agent():
     print(f"Total Savings: ₹{total_savings:,}")
     print("="*60)
 
+def test_batch_consistency(n: int = 300, seed: int = 7):
+    """Check batched_negotiate and sweep_negotiations agree with run_negotiation_test on seeded scenarios."""
+    if find_spec("numpy") is None:  # only the batch paths need it
+        print("SKIP batch consistency: NumPy not installed")
+        return
+    import random
+
+    rng = random.Random(seed)
+    products, budgets, seller_mins = [], [], []
+    for i in range(n):
+        market = rng.randint(50_000, 500_000)
+        products.append(Product(
+            name=f"Lot {i}",
+            category="Coffee",
+            quantity=rng.choice([50, 200, 500]),
+            quality_grade=rng.choice(["A", "B", "Export"]),
+            origin=rng.choice(["Colombia", "Ethiopia", "Brazil", "Kenya"]),
+            base_market_price=market,
+            attributes={}
+        ))
+        budgets.append(int(market * rng.uniform(0.6, 1.4)))
+        seller_mins.append(int(market * rng.uniform(0.6, 1.1)))
+
+    your_agent = buyer(verbose=False)
+
+    print("="*60)
+    print(f"BATCH CONSISTENCY: {n} seeded scenarios (seed={seed})")
+    print("="*60)
+
+    batched = batched_negotiate(your_agent, products, budgets, seller_mins)
+    swept = sweep_negotiations(your_agent, products, budgets, seller_mins)
+    for i, (product, buyer_budget, seller_min) in enumerate(zip(products, budgets, seller_mins)):
+        result = run_negotiation_test(your_agent, product, buyer_budget, seller_min)
+        expected = (result["final_price"] if result["deal_made"] else -1, result["rounds"])
+        for label, batch in (("batched_negotiate", batched), ("sweep_negotiations", swept)):
+            got = (int(batch["final_price"][i]), int(batch["rounds"][i]))
+            assert got == expected, f"{label} scenario {i}: (final_price, rounds) {got} != {expected}"
+
+    print(f"✅ final_price and rounds match across all three paths ({int(batched['deal_made'].sum())} deals)")
+    print("="*60)
+
 def test_seller_agent():
     """Run tests for the SELLER agent against a mock buyer."""
     product = Product(
@@ -681,9 +991,15 @@ def test_seller_agent():
     print("="*60)
 
 
-if __name__ == "_main_":
+if __name__ == "__main__":
+    import sys
+
     # Run both tests
     test_buyer_agent()
     print("\n" + "#"*60 + "\n")
     test_seller_agent()
+    # Opt-in: the batch paths need NumPy, and the sweep loads numba when installed
+    if "--batch" in sys.argv[1:]:
+        print("\n" + "#"*60 + "\n")
+        test_batch_consistency()
 